@@ -1,58 +1,271 @@
+import os
 import sys
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import List
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+from plotly.colors import qualitative
 import streamlit as st
 
+try:
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None
+
+try:
+    from tsdownsample import MinMaxLTTBDownsampler  # type: ignore
+except Exception:  # pragma: no cover
+    MinMaxLTTBDownsampler = None
+
+# Columns that identify a post; duplicates are detected on these alone
+ID_COLS = ["Post_ID"]
+
+# Bump whenever load_dataset's cleaning or dtypes change so stale Parquet snapshots are rebuilt
+SNAPSHOT_VERSION = 2
+
+
+def snapshot_is_current(df: pd.DataFrame) -> bool:
+    """Whether a cached snapshot has the dtypes the rest of the dashboard relies on."""
+    return all(
+        isinstance(df[col].dtype, pd.CategoricalDtype)
+        for col in ("Author_Type", "Content_Type")
+        if col in df.columns
+    )
+
 
 def load_dataset(csv_path: Path) -> pd.DataFrame:
-    df = pd.read_csv(csv_path)
+    # Reuse the cleaned Parquet snapshot next to the CSV when it is up to date; the
+    # version tag in the name keeps snapshots written by older cleaning code out.
+    # DASHBOARD_CHECK_DUPLICATES bypasses the snapshot so the raw CSV is always inspected.
+    parquet_path = csv_path.with_name(f"{csv_path.stem}.v{SNAPSHOT_VERSION}.parquet")
+    check_duplicates = bool(os.environ.get("DASHBOARD_CHECK_DUPLICATES"))
+    if not check_duplicates and parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        df = pd.read_parquet(parquet_path, engine="pyarrow")
+        if snapshot_is_current(df):
+            return df
+
+    # Let the parser produce final dtypes in one pass over the file
+    has_date = "Date" in pd.read_csv(csv_path, nrows=0).columns
+    df = pd.read_csv(
+        csv_path,
+        engine="pyarrow",
+        dtype_backend="pyarrow",
+        dtype={
+            "Likes": "int32[pyarrow]",
+            "Comments": "int32[pyarrow]",
+            "Shares": "int32[pyarrow]",
+            "Author_Type": "category",
+            "Content_Type": "category",
+        },
+        **({"parse_dates": ["Date"], "date_format": "%d-%m-%Y"} if has_date else {}),
+    )
 
-    # Normalize and clean
-    if "Date" in df.columns:
+    # Malformed dates leave the column unparsed; coerce them to NaT instead
+    if has_date and not pd.api.types.is_datetime64_any_dtype(df["Date"]):
         df["Date"] = pd.to_datetime(df["Date"], format="%d-%m-%Y", errors="coerce")
 
+    # Normalize the category labels (O(#categories), not O(#rows))
     if "Author_Type" in df.columns:
-        df["Author_Type"] = df["Author_Type"].astype(str).str.strip().str.title()
+        labels = df["Author_Type"].cat.categories
+        normalized = labels.str.strip().str.title()
+        if normalized.is_unique:
+            df["Author_Type"] = df["Author_Type"].cat.rename_categories(normalized)
+        else:
+            df["Author_Type"] = df["Author_Type"].map(dict(zip(labels, normalized))).astype("category")
 
     # Recompute engagement score if component metrics present
     if set(["Likes", "Comments", "Shares"]).issubset(df.columns):
-        df["Engagement_Score"] = (
-            df["Likes"].fillna(0)
-            + df["Comments"].fillna(0) * 2
-            + df["Shares"].fillna(0) * 3
+        # Work on float32 buffers directly (missing counts as 0) to avoid Series temporaries
+        likes = df["Likes"].to_numpy(np.float32, na_value=0)
+        comments = df["Comments"].to_numpy(np.float32, na_value=0)
+        shares = df["Shares"].to_numpy(np.float32, na_value=0)
+        df["Engagement_Score"] = likes + 2.0 * comments + 3.0 * shares
+
+    # Drop duplicate posts if any, hashing only the identifying columns
+    id_cols = [c for c in ID_COLS if c in df.columns] or None
+    if check_duplicates:
+        print(
+            f"Duplicates: {int(df.duplicated(subset=id_cols).sum())} by {id_cols or 'all columns'}, "
+            f"{int(df.duplicated().sum())} full rows",
+            file=sys.stderr,
         )
+    df = df.drop_duplicates(subset=id_cols).reset_index(drop=True)
 
-    # Drop duplicate rows if any
-    df = df.drop_duplicates().reset_index(drop=True)
+    # Cache the cleaned frame; a read-only checkout just skips the snapshot
+    try:
+        df.to_parquet(parquet_path, engine="pyarrow", compression="zstd")
+    except OSError:
+        pass
     return df
 
 
-@st.cache_data(show_spinner=False)
-def get_data() -> pd.DataFrame:
-    # Resolve CSV path relative to this file for portability
-    possible_paths: List[Path] = [
+@st.cache_resource(show_spinner=False)
+def _resolve_csv() -> Path:
+    # Resolve CSV path relative to this file for portability. Streamlit re-executes the
+    # script on every rerun (dropping module-level caches), so memoize via cache_resource.
+    for path in (
         Path(__file__).with_name("ai_vs_human_content_dataset.csv"),
         Path.cwd() / "ai_vs_human_content_dataset.csv",
-        Path(r"ai_vs_human_content_dataset.csv"),
-    ]
-    csv_path = next((p for p in possible_paths if p.exists()), None)
-    if csv_path is None:
-        st.stop()
-    return load_dataset(csv_path)
+    ):
+        if path.exists():
+            return path
+    raise FileNotFoundError("Could not find ai_vs_human_content_dataset.csv")
+
+
+@dataclass(frozen=True)
+class DataBundle:
+    """Dataset plus the sidebar filter bounds/options derived from it at load time."""
+
+    df: pd.DataFrame
+    date_min: pd.Timestamp
+    date_max: pd.Timestamp
+    author_types: List[str]
+    content_types: List[str]
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_data(csv_path: Path, mtime_ns: int) -> DataBundle:
+    """Load the dataset once and share the same bundle across reruns and sessions.
+
+    ``mtime_ns`` is only part of the cache key, so editing the CSV triggers a reload.
+    The returned frame is not copied: callers must treat it as read-only.
+    """
+    df = load_dataset(csv_path)
+    return DataBundle(
+        df=df,
+        date_min=df["Date"].min() if "Date" in df.columns else pd.NaT,
+        date_max=df["Date"].max() if "Date" in df.columns else pd.NaT,
+        author_types=df["Author_Type"].cat.categories.tolist() if "Author_Type" in df.columns else [],
+        content_types=df["Content_Type"].cat.categories.tolist() if "Content_Type" in df.columns else [],
+    )
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _group_sum_count(day_code, author_code, values, n_days, n_auth):
+        # rows marks which (day, author) groups exist; counts only tracks non-NaN values,
+        # so an all-NaN group still yields a NaN mean like pandas' groupby
+        sums = np.zeros((n_days, n_auth), dtype=np.float64)
+        counts = np.zeros((n_days, n_auth), dtype=np.int64)
+        rows = np.zeros((n_days, n_auth), dtype=np.int64)
+        for i in range(values.shape[0]):
+            a = author_code[i]
+            if a < 0:
+                continue
+            rows[day_code[i], a] += 1
+            v = values[i]
+            if np.isnan(v):
+                continue
+            sums[day_code[i], a] += v
+            counts[day_code[i], a] += 1
+        return sums, counts, rows
+
+
+def engagement_trend(filtered: pd.DataFrame) -> pd.DataFrame:
+    """Mean Engagement_Score per (Date, Author_Type), ordered by date then author."""
+    if njit is None:
+        return filtered.groupby(["Date", "Author_Type"], observed=True, as_index=False)["Engagement_Score"].mean()
+
+    dates = filtered["Date"]
+    valid = dates.notna().to_numpy()
+    days = dates.to_numpy()[valid].astype("datetime64[D]").view("int64")
+    if days.size == 0:
+        return pd.DataFrame({"Date": dates.iloc[:0], "Author_Type": filtered["Author_Type"].iloc[:0], "Engagement_Score": []})
+
+    first_day = days.min()
+    categories = filtered["Author_Type"].cat.categories
+    sums, counts, rows = _group_sum_count(
+        days - first_day,
+        filtered["Author_Type"].cat.codes.to_numpy()[valid],
+        filtered["Engagement_Score"].to_numpy(np.float64, na_value=np.nan)[valid],
+        int(days.max() - first_day) + 1,
+        len(categories),
+    )
+    # Dense (day, author) grid -> long frame; nonzero walks it row-major, i.e. date then author
+    day_idx, author_idx = np.nonzero(rows)
+    with np.errstate(invalid="ignore"):
+        means = sums[day_idx, author_idx] / counts[day_idx, author_idx]
+    return pd.DataFrame(
+        {
+            "Date": pd.array((first_day + day_idx).astype("datetime64[D]"), dtype=dates.dtype),
+            "Author_Type": pd.Categorical.from_codes(author_idx, dtype=filtered["Author_Type"].dtype),
+            "Engagement_Score": means,
+        }
+    )
+
+
+def downsample_trend(trend: pd.DataFrame, n_out: int = 500, min_rows: int = 1500) -> pd.DataFrame:
+    """Reduce each Author_Type series of the trend frame to ~n_out points with MinMaxLTTB."""
+    if MinMaxLTTBDownsampler is None or len(trend) < min_rows:
+        return trend
+
+    downsampler = MinMaxLTTBDownsampler()
+    parts = []
+    for _, group in trend.groupby("Author_Type", observed=True, sort=False):
+        if len(group) <= n_out:
+            parts.append(group)
+            continue
+        ts = group["Date"].to_numpy().view("int64")
+        values = group["Engagement_Score"].to_numpy(np.float64)
+        idx = downsampler.downsample(ts, values, n_out=n_out)
+        parts.append(group.iloc[idx])
+    return pd.concat(parts, ignore_index=True)
+
+
+def box_summary(frame: pd.DataFrame) -> pd.DataFrame:
+    """Quartiles and whisker fences of Engagement_Score per (Content_Type, Author_Type)."""
+    keys = [frame["Content_Type"], frame["Author_Type"]]
+    values = frame["Engagement_Score"]
+    grouped = values.groupby(keys, observed=True)
+    q1 = grouped.transform("quantile", 0.25)
+    q3 = grouped.transform("quantile", 0.75)
+    # Whiskers follow Plotly's rule: the furthest points within 1.5 x IQR of the box
+    iqr = q3 - q1
+    inside = values.where(values.between(q1 - 1.5 * iqr, q3 + 1.5 * iqr))
+    stats = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ["q1", "median", "q3"]
+    fences = inside.groupby(keys, observed=True).agg(["min", "max"])
+    stats["lowerfence"] = fences["min"]
+    stats["upperfence"] = fences["max"]
+    return stats.reset_index()
+
+
+# (divisor, format) per magnitude tier, indexed by how many thresholds the value clears
+_NUMBER_TIERS = [(1, "{:,.0f}"), (1_000, "{:.2f}K"), (1_000_000, "{:.2f}M")]
+
+
+def filter_mask(df: pd.DataFrame, start_date, end_date, author_types: List[str], content_types: List[str]) -> np.ndarray:
+    """Boolean row mask for the sidebar filters; rows with a missing filter value are excluded."""
+    mask = np.ones(len(df), dtype=bool)
+    if start_date and end_date and "Date" in df.columns:
+        in_range = df["Date"].between(pd.Timestamp(start_date), pd.Timestamp(end_date))
+        # Arrow-backed comparisons yield NA for null dates; treat those as not matching
+        mask &= in_range.to_numpy(dtype=bool, na_value=False)
+
+    if author_types and "Author_Type" in df.columns:
+        mask &= df["Author_Type"].isin(author_types).to_numpy(dtype=bool, na_value=False)
+
+    if content_types and "Content_Type" in df.columns:
+        mask &= df["Content_Type"].isin(content_types).to_numpy(dtype=bool, na_value=False)
+    return mask
+
+
+def author_color_map(author_types: List[str]) -> dict:
+    """Fixed colour per author type, cycling through the Plotly palette like Plotly Express does."""
+    palette = qualitative.Plotly
+    return {author_type: palette[i % len(palette)] for i, author_type in enumerate(author_types)}
 
 
 def format_big_number(value: float) -> str:
     if pd.isna(value):
         return "-"
-    if value >= 1_000_000:
-        return f"{value/1_000_000:.2f}M"
-    if value >= 1_000:
-        return f"{value/1_000:.2f}K"
-    return f"{value:,.0f}"
+    divisor, fmt = _NUMBER_TIERS[int(value >= 1_000) + int(value >= 1_000_000)]
+    return fmt.format(value / divisor)
 
 
 def main() -> None:
@@ -66,16 +279,17 @@ def main() -> None:
     st.title("AI vs Human Content Dashboard")
     st.caption("Interactive dashboard comparing engagement across AI-generated and human-written content.")
 
-    df = get_data()
+    csv_path = _resolve_csv()
+    data = get_data(csv_path, csv_path.stat().st_mtime_ns)
+    df = data.df
 
     # Sidebar filters
     with st.sidebar:
         st.header("Filters")
 
         # Date range
-        min_date = pd.to_datetime(df["Date"]).min() if "Date" in df.columns else None
-        max_date = pd.to_datetime(df["Date"]).max() if "Date" in df.columns else None
-        if min_date is not None and pd.notna(min_date):
+        min_date, max_date = data.date_min, data.date_max
+        if pd.notna(min_date):
             start_date, end_date = st.date_input(
                 "Date range",
                 value=(min_date.date(), max_date.date()),
@@ -86,7 +300,7 @@ def main() -> None:
             start_date, end_date = None, None
 
         # Author type filter
-        author_types = sorted(df["Author_Type"].dropna().unique().tolist()) if "Author_Type" in df.columns else []
+        author_types = data.author_types
         selected_author_types = st.multiselect(
             "Author type",
             options=author_types,
@@ -94,34 +308,49 @@ def main() -> None:
         )
 
         # Content type filter
-        content_types = sorted(df["Content_Type"].dropna().unique().tolist()) if "Content_Type" in df.columns else []
+        content_types = data.content_types
         selected_content_types = st.multiselect(
             "Content type",
             options=content_types,
             default=content_types,
         )
 
-    # Apply filters
-    filtered = df.copy()
-    if start_date and end_date and "Date" in filtered.columns:
-        mask = (filtered["Date"] >= pd.Timestamp(start_date)) & (filtered["Date"] <= pd.Timestamp(end_date))
-        filtered = filtered.loc[mask]
-
-    if selected_author_types and "Author_Type" in filtered.columns:
-        filtered = filtered[filtered["Author_Type"].isin(selected_author_types)]
-
-    if selected_content_types and "Content_Type" in filtered.columns:
-        filtered = filtered[filtered["Content_Type"].isin(selected_content_types)]
+    # Apply filters: combine into one mask and index the frame once
+    mask = filter_mask(df, start_date, end_date, selected_author_types, selected_content_types)
+    filtered = df.loc[mask]
 
     if filtered.empty:
         st.warning("No data matches the current filters. Adjust filters to see results.")
         st.stop()
 
+    # Per-author aggregates in one pass; KPIs and author charts are derived from these.
+    # Only columns present in the data are aggregated, so a missing metric shows "-".
+    metric_aggs = {
+        "eng_mean": ("Engagement_Score", "mean"),
+        "eng_sum": ("Engagement_Score", "sum"),
+        "eng_count": ("Engagement_Score", "count"),
+        "likes": ("Likes", "sum"),
+        "comments_sum": ("Comments", "sum"),
+        "comments_count": ("Comments", "count"),
+        "shares": ("Shares", "sum"),
+    }
+    agg_spec = {name: spec for name, spec in metric_aggs.items() if spec[0] in filtered.columns}
+    if "Author_Type" in filtered.columns:
+        author_key = filtered["Author_Type"]
+    else:
+        author_key = pd.Series("All", index=filtered.index, name="Author_Type")
+    if agg_spec:
+        by_author = filtered.groupby(author_key, observed=True).agg(**agg_spec)
+    else:
+        by_author = pd.DataFrame(index=pd.Index([], name="Author_Type"))
+    totals = by_author.sum()
+    by_author = by_author.reset_index()
+
     # KPIs
-    total_likes = float(filtered["Likes"].sum()) if "Likes" in filtered.columns else float("nan")
-    avg_comments = float(filtered["Comments"].mean()) if "Comments" in filtered.columns else float("nan")
-    total_shares = float(filtered["Shares"].sum()) if "Shares" in filtered.columns else float("nan")
-    avg_engagement = float(filtered["Engagement_Score"].mean()) if "Engagement_Score" in filtered.columns else float("nan")
+    total_likes = float(totals["likes"]) if "likes" in totals else float("nan")
+    avg_comments = float(totals["comments_sum"] / totals["comments_count"]) if totals.get("comments_count", 0) else float("nan")
+    total_shares = float(totals["shares"]) if "shares" in totals else float("nan")
+    avg_engagement = float(totals["eng_sum"] / totals["eng_count"]) if totals.get("eng_count", 0) else float("nan")
 
     c1, c2, c3, c4 = st.columns(4)
     with c1:
@@ -133,62 +362,94 @@ def main() -> None:
     with c4:
         st.metric("Avg Engagement Score", f"{avg_engagement:.2f}" if pd.notna(avg_engagement) else "-")
 
+    # Charts are built from the aggregated frames as graph_objects traces, with one colour per author type
+    author_colors = author_color_map(data.author_types)
+    author_labels = by_author["Author_Type"].to_numpy()
+
     # Comparison chart: AI vs Human engagement (average)
     if set(["Author_Type", "Engagement_Score"]).issubset(filtered.columns):
-        engagement_by_author = (
-            filtered.groupby("Author_Type", as_index=False)["Engagement_Score"].mean().rename(columns={"Engagement_Score": "Avg Engagement"})
+        fig_bar = go.Figure(
+            go.Bar(
+                x=author_labels,
+                y=by_author["eng_mean"].to_numpy(),
+                text=by_author["eng_mean"].to_numpy(),
+                texttemplate="%{text:.2f}",
+                marker_color=[author_colors[a] for a in author_labels],
+            )
         )
-        fig_bar = px.bar(
-            engagement_by_author,
-            x="Author_Type",
-            y="Avg Engagement",
-            color="Author_Type",
+        fig_bar.update_layout(
             title="Average Engagement Score: AI vs Human",
-            text_auto=".2f",
+            showlegend=False,
+            xaxis_title="Author Type",
+            yaxis_title="Avg Engagement Score",
         )
-        fig_bar.update_layout(showlegend=False, xaxis_title="Author Type", yaxis_title="Avg Engagement Score")
         st.plotly_chart(fig_bar, use_container_width=True)
 
     # Trendline over time by author type (average engagement)
     if set(["Date", "Author_Type", "Engagement_Score"]).issubset(filtered.columns):
-        trend = (
-            filtered.sort_values("Date").groupby(["Date", "Author_Type"], as_index=False)["Engagement_Score"].mean()
-        )
-        fig_trend = px.line(
-            trend,
-            x="Date",
-            y="Engagement_Score",
-            color="Author_Type",
+        trend = downsample_trend(engagement_trend(filtered))
+        fig_trend = go.Figure()
+        for author_type, group in trend.groupby("Author_Type", observed=True):
+            # WebGL lines instead of SVG paths; a single chart stays well under browser WebGL-context limits
+            fig_trend.add_trace(
+                go.Scattergl(
+                    x=group["Date"].to_numpy(),
+                    y=group["Engagement_Score"].to_numpy(),
+                    mode="lines",
+                    name=author_type,
+                    line_color=author_colors[author_type],
+                )
+            )
+        fig_trend.update_layout(
             title="Engagement Trend Over Time",
+            legend_title_text="Author_Type",
+            xaxis_title="Date",
+            yaxis_title="Avg Engagement Score",
         )
-        fig_trend.update_layout(xaxis_title="Date", yaxis_title="Avg Engagement Score")
         st.plotly_chart(fig_trend, use_container_width=True)
 
     col_left, col_right = st.columns(2)
     with col_left:
         # Pie chart: % of total engagement by author type
         if set(["Author_Type", "Engagement_Score"]).issubset(filtered.columns):
-            engagement_share = filtered.groupby("Author_Type", as_index=False)["Engagement_Score"].sum()
-            fig_pie = px.pie(
-                engagement_share,
-                names="Author_Type",
-                values="Engagement_Score",
-                title="Share of Total Engagement by Author Type",
-                hole=0.3,
+            fig_pie = go.Figure(
+                go.Pie(
+                    labels=author_labels,
+                    values=by_author["eng_sum"].to_numpy(),
+                    marker_colors=[author_colors[a] for a in author_labels],
+                    sort=False,
+                    hole=0.3,
+                )
             )
+            fig_pie.update_layout(title="Share of Total Engagement by Author Type")
             st.plotly_chart(fig_pie, use_container_width=True)
 
     with col_right:
         # Content type analysis: box plot of engagement by content type, colored by author type
         if set(["Content_Type", "Engagement_Score", "Author_Type"]).issubset(filtered.columns):
-            fig_box = px.box(
-                filtered,
-                x="Content_Type",
-                y="Engagement_Score",
-                color="Author_Type",
+            # Ship precomputed quartiles rather than every row for Plotly to summarize client-side
+            stats = box_summary(filtered)
+            fig_box = go.Figure()
+            for author_type, group in stats.groupby("Author_Type", observed=True):
+                fig_box.add_trace(
+                    go.Box(
+                        x=group["Content_Type"].to_numpy(),
+                        q1=group["q1"].to_numpy(),
+                        median=group["median"].to_numpy(),
+                        q3=group["q3"].to_numpy(),
+                        lowerfence=group["lowerfence"].to_numpy(),
+                        upperfence=group["upperfence"].to_numpy(),
+                        name=author_type,
+                        marker_color=author_colors[author_type],
+                    )
+                )
+            fig_box.update_layout(
                 title="Engagement by Content Type (AI vs Human)",
+                boxmode="group",
+                legend_title_text="Author_Type",
+                xaxis_title="Content Type",
+                yaxis_title="Engagement Score",
             )
-            fig_box.update_layout(xaxis_title="Content Type", yaxis_title="Engagement Score")
             fig_box.update_xaxes(tickangle=45)
             st.plotly_chart(fig_box, use_container_width=True)
 
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from docx import Document
 from docx.shared import Inches
@@ -6,6 +7,62 @@ from docx.oxml.shared import OxmlElement, qn
 from pathlib import Path
 import sys
 
+from dashboard import load_dataset
+
+try:
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None
+
+# Metrics averaged per author type, in the column order fed to the kernel
+MEAN_COLUMNS = {
+    'engagement_mean': 'Engagement_Score',
+    'likes_mean': 'Likes',
+    'comments_mean': 'Comments',
+    'shares_mean': 'Shares',
+}
+
+if njit is not None:
+
+    @njit(cache=True)
+    def per_author_means(codes, vals, k):
+        """(k, m) NaN-skipping means of vals grouped by integer codes, in one pass"""
+        m = vals.shape[1]
+        sums = np.zeros((k, m), dtype=np.float64)
+        counts = np.zeros((k, m), dtype=np.int64)
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            if c < 0:
+                continue
+            for j in range(m):
+                v = vals[i, j]
+                if not np.isnan(v):
+                    sums[c, j] += v
+                    counts[c, j] += 1
+        means = np.full((k, m), np.nan)
+        for c in range(k):
+            for j in range(m):
+                if counts[c, j] > 0:
+                    means[c, j] = sums[c, j] / counts[c, j]
+        return means
+
+def author_means(df):
+    """Per-author means of the MEAN_COLUMNS metrics plus post counts"""
+    if njit is None:
+        # Plain float64 means so reindexing a missing author type yields NaN, not pd.NA
+        return df.groupby('Author_Type', observed=True).agg(
+            n=('Engagement_Score', 'size'),
+            **{name: (col, 'mean') for name, col in MEAN_COLUMNS.items()},
+        ).astype({name: 'float64' for name in MEAN_COLUMNS})
+    
+    categories = df['Author_Type'].cat.categories
+    codes = df['Author_Type'].cat.codes.to_numpy()
+    vals = df[list(MEAN_COLUMNS.values())].to_numpy(np.float32, na_value=np.nan)
+    means = per_author_means(codes, vals, len(categories))
+    result = pd.DataFrame(means, index=categories.rename('Author_Type'), columns=list(MEAN_COLUMNS))
+    result.insert(0, 'n', np.bincount(codes[codes >= 0], minlength=len(categories)))
+    return result
+
 def load_and_analyze_data():
     """Load and analyze the dataset to extract key insights"""
     try:
@@ -24,56 +81,46 @@ def load_and_analyze_data():
         if csv_path is None:
             raise FileNotFoundError("Could not find the CSV file")
             
-        df = pd.read_csv(csv_path)
-        
-        # Clean data (same as dashboard)
-        if "Date" in df.columns:
-            df["Date"] = pd.to_datetime(df["Date"], format="%d-%m-%Y", errors="coerce")
-        
-        if "Author_Type" in df.columns:
-            df["Author_Type"] = df["Author_Type"].astype(str).str.strip().str.title()
-        
-        if set(["Likes", "Comments", "Shares"]).issubset(df.columns):
-            df["Engagement_Score"] = (
-                df["Likes"].fillna(0) + 
-                df["Comments"].fillna(0) * 2 + 
-                df["Shares"].fillna(0) * 3
-            )
-        
-        df = df.drop_duplicates().reset_index(drop=True)
+        # Same load and cleaning as the dashboard (reuses its Parquet snapshot)
+        df = load_dataset(csv_path)
         
         # Calculate key metrics
         insights = {}
         
+        # Per-author metrics in a single pass
+        by_author = author_means(df).reindex(['Ai', 'Human'])
+        by_author['n'] = by_author['n'].fillna(0)
+        ai_stats = by_author.loc['Ai']
+        human_stats = by_author.loc['Human']
+        
         # Overall metrics
         insights['total_posts'] = len(df)
-        insights['ai_posts'] = len(df[df['Author_Type'] == 'Ai'])
-        insights['human_posts'] = len(df[df['Author_Type'] == 'Human'])
+        insights['ai_posts'] = int(ai_stats['n'])
+        insights['human_posts'] = int(human_stats['n'])
         
         # Engagement metrics by author type
-        ai_data = df[df['Author_Type'] == 'Ai']
-        human_data = df[df['Author_Type'] == 'Human']
-        
-        insights['ai_avg_engagement'] = ai_data['Engagement_Score'].mean()
-        insights['human_avg_engagement'] = human_data['Engagement_Score'].mean()
-        insights['ai_avg_likes'] = ai_data['Likes'].mean()
-        insights['human_avg_likes'] = human_data['Likes'].mean()
-        insights['ai_avg_comments'] = ai_data['Comments'].mean()
-        insights['human_avg_comments'] = human_data['Comments'].mean()
-        insights['ai_avg_shares'] = ai_data['Shares'].mean()
-        insights['human_avg_shares'] = human_data['Shares'].mean()
+        insights['ai_avg_engagement'] = ai_stats['engagement_mean']
+        insights['human_avg_engagement'] = human_stats['engagement_mean']
+        insights['ai_avg_likes'] = ai_stats['likes_mean']
+        insights['human_avg_likes'] = human_stats['likes_mean']
+        insights['ai_avg_comments'] = ai_stats['comments_mean']
+        insights['human_avg_comments'] = human_stats['comments_mean']
+        insights['ai_avg_shares'] = ai_stats['shares_mean']
+        insights['human_avg_shares'] = human_stats['shares_mean']
         
         # Content type analysis
-        content_performance = df.groupby(['Content_Type', 'Author_Type'])['Engagement_Score'].mean().unstack()
+        content_performance = df.groupby(['Content_Type', 'Author_Type'], observed=True)['Engagement_Score'].mean().unstack()
         insights['content_performance'] = content_performance
         
         # Top performing content types
-        top_content = df.groupby('Content_Type')['Engagement_Score'].mean().sort_values(ascending=False)
+        top_content = df.groupby('Content_Type', observed=True)['Engagement_Score'].mean().sort_values(ascending=False)
         insights['top_content_types'] = top_content.head(3)
         
         # Engagement trend
         if 'Date' in df.columns:
-            monthly_trend = df.groupby([df['Date'].dt.to_period('M'), 'Author_Type'])['Engagement_Score'].mean().unstack()
+            # Arrow timestamps have no period accessor; convert just for the month key
+            month = df['Date'].astype('datetime64[s]').dt.to_period('M')
+            monthly_trend = df.groupby([month, 'Author_Type'], observed=True)['Engagement_Score'].mean().unstack()
             insights['monthly_trend'] = monthly_trend
         
         return insights, df
@@ -82,6 +129,12 @@ def load_and_analyze_data():
         print(f"Error loading data: {e}")
         return None, None
 
+def para(doc, *chunks):
+    """Add a paragraph holding all plain-text chunks as a single run"""
+    p = doc.add_paragraph()
+    p.add_run(''.join(chunks))
+    return p
+
 def create_analysis_report(insights, df):
     """Create a Word document with the analysis report"""
     doc = Document()
@@ -92,10 +145,12 @@ def create_analysis_report(insights, df):
     
     # Executive Summary
     doc.add_heading('Executive Summary', level=1)
-    summary = doc.add_paragraph()
-    summary.add_run('This report analyzes the performance of AI-generated content versus human-written content based on social media engagement metrics. ')
-    summary.add_run(f'We examined {insights["total_posts"]} posts ({insights["ai_posts"]} AI-generated, {insights["human_posts"]} human-written) ')
-    summary.add_run('to understand which type of content drives better audience engagement.')
+    para(
+        doc,
+        'This report analyzes the performance of AI-generated content versus human-written content based on social media engagement metrics. ',
+        f'We examined {insights["total_posts"]} posts ({insights["ai_posts"]} AI-generated, {insights["human_posts"]} human-written) ',
+        'to understand which type of content drives better audience engagement.',
+    )
     
     # Key Findings
     doc.add_heading('Key Findings', level=1)
@@ -108,118 +163,123 @@ def create_analysis_report(insights, df):
     
     if ai_engagement > human_engagement:
         diff_percent = ((ai_engagement - human_engagement) / human_engagement) * 100
-        finding1 = doc.add_paragraph()
-        finding1.add_run(f'AI-generated content outperformed human-written content by {diff_percent:.1f}% in overall engagement. ')
-        finding1.add_run(f'AI posts achieved an average engagement score of {ai_engagement:.0f}, ')
-        finding1.add_run(f'while human posts averaged {human_engagement:.0f}.')
+        para(
+            doc,
+            f'AI-generated content outperformed human-written content by {diff_percent:.1f}% in overall engagement. ',
+            f'AI posts achieved an average engagement score of {ai_engagement:.0f}, ',
+            f'while human posts averaged {human_engagement:.0f}.',
+        )
     else:
         diff_percent = ((human_engagement - ai_engagement) / ai_engagement) * 100
-        finding1 = doc.add_paragraph()
-        finding1.add_run(f'Human-written content outperformed AI-generated content by {diff_percent:.1f}% in overall engagement. ')
-        finding1.add_run(f'Human posts achieved an average engagement score of {human_engagement:.0f}, ')
-        finding1.add_run(f'while AI posts averaged {ai_engagement:.0f}.')
+        para(
+            doc,
+            f'Human-written content outperformed AI-generated content by {diff_percent:.1f}% in overall engagement. ',
+            f'Human posts achieved an average engagement score of {human_engagement:.0f}, ',
+            f'while AI posts averaged {ai_engagement:.0f}.',
+        )
     
     # Finding 2: Engagement Breakdown
     doc.add_heading('2. Engagement Metric Breakdown', level=2)
     
-    breakdown = doc.add_paragraph()
-    breakdown.add_run('When we break down engagement by individual metrics:\n\n')
-    
-    # Likes comparison
     ai_likes = insights['ai_avg_likes']
     human_likes = insights['human_avg_likes']
-    breakdown.add_run(f'• Likes: AI posts received {ai_likes:.0f} average likes vs {human_likes:.0f} for human posts\n')
-    
-    # Comments comparison
     ai_comments = insights['ai_avg_comments']
     human_comments = insights['human_avg_comments']
-    breakdown.add_run(f'• Comments: AI posts received {ai_comments:.0f} average comments vs {human_comments:.0f} for human posts\n')
-    
-    # Shares comparison
     ai_shares = insights['ai_avg_shares']
     human_shares = insights['human_avg_shares']
-    breakdown.add_run(f'• Shares: AI posts received {ai_shares:.0f} average shares vs {human_shares:.0f} for human posts')
+    para(
+        doc,
+        'When we break down engagement by individual metrics:\n\n',
+        f'• Likes: AI posts received {ai_likes:.0f} average likes vs {human_likes:.0f} for human posts\n',
+        f'• Comments: AI posts received {ai_comments:.0f} average comments vs {human_comments:.0f} for human posts\n',
+        f'• Shares: AI posts received {ai_shares:.0f} average shares vs {human_shares:.0f} for human posts',
+    )
     
     # Finding 3: Content Type Performance
     doc.add_heading('3. Content Type Analysis', level=2)
     
-    content_analysis = doc.add_paragraph()
-    content_analysis.add_run('Different content types perform differently for AI vs Human authors:\n\n')
-    
     # Get top performing content types
     top_content = insights['top_content_types']
-    content_analysis.add_run('Top 3 performing content types overall:\n')
-    for i, (content_type, score) in enumerate(top_content.items(), 1):
-        content_analysis.add_run(f'{i}. {content_type}: {score:.0f} average engagement\n')
+    para(
+        doc,
+        'Different content types perform differently for AI vs Human authors:\n\n',
+        'Top 3 performing content types overall:\n',
+        *(f'{i}. {content_type}: {score:.0f} average engagement\n' for i, (content_type, score) in enumerate(top_content.items(), 1)),
+    )
     
     # Finding 4: Business Implications
     doc.add_heading('4. Business Implications', level=2)
     
-    implications = doc.add_paragraph()
-    implications.add_run('Based on our analysis, here are the key business implications:\n\n')
-    
     if ai_engagement > human_engagement:
-        implications.add_run('• AI-generated content shows strong potential for driving engagement\n')
-        implications.add_run('• Consider incorporating AI tools into content creation workflows\n')
-        implications.add_run('• AI content may be more cost-effective for maintaining consistent posting schedules\n')
+        strategy_points = (
+            '• AI-generated content shows strong potential for driving engagement\n',
+            '• Consider incorporating AI tools into content creation workflows\n',
+            '• AI content may be more cost-effective for maintaining consistent posting schedules\n',
+        )
     else:
-        implications.add_run('• Human-written content maintains an edge in audience connection\n')
-        implications.add_run('• Focus on human creativity and personal touch in content strategy\n')
-        implications.add_run('• Consider AI as a supplement rather than replacement for human content\n')
-    
-    implications.add_run('• Monitor engagement trends over time to adapt strategy accordingly\n')
-    implications.add_run('• Test different content types to optimize for your specific audience')
+        strategy_points = (
+            '• Human-written content maintains an edge in audience connection\n',
+            '• Focus on human creativity and personal touch in content strategy\n',
+            '• Consider AI as a supplement rather than replacement for human content\n',
+        )
+    para(
+        doc,
+        'Based on our analysis, here are the key business implications:\n\n',
+        *strategy_points,
+        '• Monitor engagement trends over time to adapt strategy accordingly\n',
+        '• Test different content types to optimize for your specific audience',
+    )
     
     # Recommendations
     doc.add_heading('Recommendations', level=1)
     
-    recommendations = doc.add_paragraph()
-    recommendations.add_run('Based on our findings, we recommend:\n\n')
-    
-    recommendations.add_run('1. ')
     if ai_engagement > human_engagement:
-        recommendations.add_run('Gradually incorporate AI-generated content into your content strategy\n')
+        first_recommendation = 'Gradually incorporate AI-generated content into your content strategy\n'
     else:
-        recommendations.add_run('Maintain focus on human-created content while exploring AI as a supplement\n')
-    
-    recommendations.add_run('2. ')
-    recommendations.add_run('Focus on content types that show the highest engagement for your target audience\n')
-    
-    recommendations.add_run('3. ')
-    recommendations.add_run('Implement A/B testing to compare AI vs Human content performance in your specific context\n')
-    
-    recommendations.add_run('4. ')
-    recommendations.add_run('Monitor engagement metrics regularly to track performance trends\n')
-    
-    recommendations.add_run('5. ')
-    recommendations.add_run('Consider hybrid approaches: use AI for initial drafts and human editors for final touches')
+        first_recommendation = 'Maintain focus on human-created content while exploring AI as a supplement\n'
+    para(
+        doc,
+        'Based on our findings, we recommend:\n\n',
+        '1. ', first_recommendation,
+        '2. Focus on content types that show the highest engagement for your target audience\n',
+        '3. Implement A/B testing to compare AI vs Human content performance in your specific context\n',
+        '4. Monitor engagement metrics regularly to track performance trends\n',
+        '5. Consider hybrid approaches: use AI for initial drafts and human editors for final touches',
+    )
     
     # Methodology
     doc.add_heading('Methodology', level=1)
     
-    methodology = doc.add_paragraph()
-    methodology.add_run('This analysis was conducted using:\n\n')
-    methodology.add_run(f'• Dataset: {insights["total_posts"]} social media posts\n')
-    methodology.add_run(f'• Time period: {df["Date"].min().strftime("%B %Y")} to {df["Date"].max().strftime("%B %Y")}\n')
-    methodology.add_run('• Engagement Score Formula: Likes + (2 × Comments) + (3 × Shares)\n')
-    methodology.add_run('• Analysis tools: Python, Pandas, and statistical analysis\n')
-    methodology.add_run('• Visualization: Interactive dashboard with real-time filtering capabilities')
+    para(
+        doc,
+        'This analysis was conducted using:\n\n',
+        f'• Dataset: {insights["total_posts"]} social media posts\n',
+        f'• Time period: {df["Date"].min().strftime("%B %Y")} to {df["Date"].max().strftime("%B %Y")}\n',
+        '• Engagement Score Formula: Likes + (2 × Comments) + (3 × Shares)\n',
+        '• Analysis tools: Python, Pandas, and statistical analysis\n',
+        '• Visualization: Interactive dashboard with real-time filtering capabilities',
+    )
     
     # Conclusion
     doc.add_heading('Conclusion', level=1)
     
-    conclusion = doc.add_paragraph()
-    conclusion.add_run('This analysis provides valuable insights into the performance of AI-generated versus human-written content. ')
-    
     if ai_engagement > human_engagement:
-        conclusion.add_run('The data suggests that AI-generated content can effectively drive engagement, ')
-        conclusion.add_run('offering opportunities for cost-effective content creation while maintaining audience interest.')
+        outlook = (
+            'The data suggests that AI-generated content can effectively drive engagement, '
+            'offering opportunities for cost-effective content creation while maintaining audience interest.'
+        )
     else:
-        conclusion.add_run('The data reinforces the value of human creativity in content creation, ')
-        conclusion.add_run('while also highlighting opportunities for strategic use of AI tools.')
-    
-    conclusion.add_run('\n\nHowever, the most successful content strategies will likely involve a thoughtful blend of both approaches, ')
-    conclusion.add_run('tailored to your specific audience and business objectives.')
+        outlook = (
+            'The data reinforces the value of human creativity in content creation, '
+            'while also highlighting opportunities for strategic use of AI tools.'
+        )
+    para(
+        doc,
+        'This analysis provides valuable insights into the performance of AI-generated versus human-written content. ',
+        outlook,
+        '\n\nHowever, the most successful content strategies will likely involve a thoughtful blend of both approaches, ',
+        'tailored to your specific audience and business objectives.',
+    )
     
     # Footer
     doc.add_paragraph()
@@ -1,64 +1,81 @@
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import plotly.graph_objects as go
 
-# Step 2: Load dataset
-df = pd.read_csv("C:\\Users\\Sakshi\\Desktop\\ai_vs_human_content_dataset.csv")
 
-# Step 3: First look at data
-print(df.head())      # First 5 rows
-print(df.info())      # Data types & null values
-print(df.describe())  # Summary statistics
+def main():
+    # Step 2: Load dataset
+    df = pd.read_csv("C:\\Users\\Sakshi\\Desktop\\ai_vs_human_content_dataset.csv")
 
-# -----------------------------
-# 🧹 DATA CLEANING
-# -----------------------------
+    # Step 3: First look at data
+    print(df.head())      # First 5 rows
+    print(df.info())      # Data types & null values
+    print(df.describe())  # Summary statistics
 
-# Convert Date column to datetime
-df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y')
+    # -----------------------------
+    # 🧹 DATA CLEANING
+    # -----------------------------
 
+    # Convert Date column to datetime
+    df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y')
 
-# Check for missing values
-print(df.isnull().sum())
 
-# Drop duplicates if any
-df.drop_duplicates(inplace=True)
+    # Check for missing values
+    print(df.isnull().sum())
 
+    # Drop duplicates if any
+    df.drop_duplicates(inplace=True)
 
-# Standardize Author_Type values (AI/Human)
-df['Author_Type'] = df['Author_Type'].str.strip().str.title()
 
-# Recalculate Engagement_Score (in case needed)
-df['Engagement_Score'] = df['Likes'] + df['Comments']*2 + df['Shares']*3
+    # Standardize Author_Type values (AI/Human)
+    df['Author_Type'] = df['Author_Type'].str.strip().str.title()
 
+    # Recalculate Engagement_Score (in case needed)
+    likes = df['Likes'].to_numpy(np.float32, na_value=0)
+    comments = df['Comments'].to_numpy(np.float32, na_value=0)
+    shares = df['Shares'].to_numpy(np.float32, na_value=0)
+    df['Engagement_Score'] = likes + 2.0*comments + 3.0*shares
 
 
-# -----------------------------
-# 🔍 EXPLORATORY DATA ANALYSIS (EDA)
-# -----------------------------
 
-# 1. Average engagement by Author Type
-avg_engagement = df.groupby("Author_Type")['Engagement_Score'].mean()
-print(avg_engagement)
+    # -----------------------------
+    # 🔍 EXPLORATORY DATA ANALYSIS (EDA)
+    # -----------------------------
 
-# 2. Total Likes, Comments, Shares by Author Type
-totals = df.groupby("Author_Type")[['Likes','Comments','Shares']].sum()
-print(totals)
+    # 1 & 2. Average engagement and total Likes, Comments, Shares by Author Type (one pass)
+    by_author = df.groupby("Author_Type").agg(
+        avg_engagement=('Engagement_Score', 'mean'),
+        Likes=('Likes', 'sum'),
+        Comments=('Comments', 'sum'),
+        Shares=('Shares', 'sum'),
+    )
+    avg_engagement = by_author['avg_engagement']
+    print(avg_engagement)
+    print(by_author[['Likes', 'Comments', 'Shares']])
 
-# 3. Plot: Avg Engagement (AI vs Human)
-sns.barplot(x=avg_engagement.index, y=avg_engagement.values)
-plt.title("Average Engagement Score (AI vs Human)")
-plt.ylabel("Engagement Score")
-plt.show()
+    # 3. Plot: Avg Engagement (AI vs Human)
+    fig = go.Figure(go.Bar(x=avg_engagement.index.to_numpy(), y=avg_engagement.to_numpy()))
+    fig.update_layout(title="Average Engagement Score (AI vs Human)", yaxis_title="Engagement Score")
+    fig.show()
 
-# 4. Trend over time
-df.groupby(['Date','Author_Type'])['Engagement_Score'].mean().unstack().plot(kind='line')
-plt.title("Engagement Trend Over Time")
-plt.ylabel("Avg Engagement Score")
-plt.show()
+    # 4. Trend over time
+    trend = df.groupby(['Date', 'Author_Type'])['Engagement_Score'].mean().unstack()
+    fig = go.Figure([
+        go.Scatter(x=trend.index.to_numpy(), y=trend[author].to_numpy(), mode="lines", name=author)
+        for author in trend.columns
+    ])
+    fig.update_layout(title="Engagement Trend Over Time", yaxis_title="Avg Engagement Score")
+    fig.show()
 
-# 5. Content type analysis
-sns.boxplot(data=df, x="Content_Type", y="Engagement_Score", hue="Author_Type")
-plt.title("Engagement by Content Type (AI vs Human)")
-plt.xticks(rotation=45)
-plt.show()
\ No newline at end of file
+    # 5. Content type analysis
+    fig = go.Figure([
+        go.Box(x=group['Content_Type'].to_numpy(), y=group['Engagement_Score'].to_numpy(), name=author)
+        for author, group in df.groupby("Author_Type")
+    ])
+    fig.update_layout(title="Engagement by Content Type (AI vs Human)", boxmode="group")
+    fig.update_xaxes(tickangle=45)
+    fig.show()
+
+
+if __name__ == "__main__":
+    main()
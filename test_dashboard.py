@@ -0,0 +1,156 @@
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import dashboard
+
+CSV_HEADER = "Post_ID,Author_Type,Content_Type,Likes,Comments,Shares,Date,Word_Count,Engagement_Score\n"
+
+
+def write_csv(tmp_path: Path, rows: str) -> Path:
+    csv_path = tmp_path / "ai_vs_human_content_dataset.csv"
+    csv_path.write_text(CSV_HEADER + rows, encoding="utf-8")
+    return csv_path
+
+
+def test_stale_snapshot_is_rebuilt(tmp_path):
+    csv_path = write_csv(tmp_path, "1,AI,Marketing,10,2,1,17-08-2025,44,17\n")
+    parquet_path = tmp_path / f"ai_vs_human_content_dataset.v{dashboard.SNAPSHOT_VERSION}.parquet"
+
+    # Snapshot with the right tag but pre-categorical dtypes, newer than the CSV
+    pd.read_csv(csv_path).to_parquet(parquet_path, engine="pyarrow")
+    mtime = csv_path.stat().st_mtime + 10
+    os.utime(parquet_path, (mtime, mtime))
+
+    df = dashboard.load_dataset(csv_path)
+    assert isinstance(df["Author_Type"].dtype, pd.CategoricalDtype)
+    assert df["Author_Type"].cat.categories.tolist() == ["Ai"]
+    assert dashboard.snapshot_is_current(pd.read_parquet(parquet_path, engine="pyarrow"))
+
+
+def test_csv_without_date_column(tmp_path):
+    csv_path = tmp_path / "ai_vs_human_content_dataset.csv"
+    csv_path.write_text("Post_ID,Author_Type,Content_Type,Likes,Comments,Shares\n1,AI,Marketing,10,2,1\n", encoding="utf-8")
+
+    df = dashboard.load_dataset(csv_path)
+    assert "Date" not in df.columns
+    assert df["Engagement_Score"].tolist() == [17.0]
+
+
+def test_blank_date_is_filtered_out(tmp_path):
+    csv_path = write_csv(
+        tmp_path,
+        "1,AI,Marketing,10,2,1,17-08-2025,44,17\n"
+        "2,Human,Learning,20,1,0,15-07-2025,50,22\n"
+        "3,AI,Marketing,1,5,2,,10,0\n",
+    )
+    df = dashboard.load_dataset(csv_path)
+
+    mask = dashboard.filter_mask(df, df["Date"].min(), df["Date"].max(), ["Ai", "Human"], ["Marketing", "Learning"])
+    assert mask.dtype == bool
+    assert df.loc[mask, "Post_ID"].tolist() == [1, 2]
+
+    trend = dashboard.engagement_trend(df.loc[mask])
+    assert trend["Engagement_Score"].tolist() == [22.0, 17.0]
+
+
+def test_format_big_number_accepts_numpy_scalars():
+    for value, expected in [(5, "5"), (12_345, "12.35K"), (5_000_000, "5.00M")]:
+        for cast in (float, np.float64, np.float32, np.int64):
+            assert dashboard.format_big_number(cast(value)) == expected
+    assert dashboard.format_big_number(float("nan")) == "-"
+
+
+def test_author_colors_cycle_past_palette():
+    author_types = [f"Author {i}" for i in range(12)]
+    colors = dashboard.author_color_map(author_types)
+    assert set(colors) == set(author_types)
+    assert colors["Author 10"] == colors["Author 0"]
+
+
+def run_app(tmp_path: Path, csv_text: str):
+    # Run a copy of the dashboard next to a custom CSV so _resolve_csv picks it up
+    from streamlit.testing.v1 import AppTest
+
+    st.cache_resource.clear()
+    script = tmp_path / "dashboard.py"
+    shutil.copy(Path(dashboard.__file__), script)
+    (tmp_path / "ai_vs_human_content_dataset.csv").write_text(csv_text, encoding="utf-8")
+    app = AppTest.from_file(str(script), default_timeout=60)
+    app.run()
+    st.cache_resource.clear()
+    return app
+
+
+def test_dashboard_without_shares_column(tmp_path):
+    app = run_app(
+        tmp_path,
+        "Post_ID,Author_Type,Content_Type,Likes,Comments,Date\n"
+        "1,AI,Marketing,10,2,17-08-2025\n"
+        "2,Human,Learning,20,4,15-07-2025\n",
+    )
+    assert not app.exception
+    assert not app.error
+    assert {m.label: m.value for m in app.metric} == {
+        "Total Likes": "30",
+        "Avg Comments": "3.00",
+        "Total Shares": "-",
+        "Avg Engagement Score": "-",
+    }
+
+
+def test_box_summary_quartiles_and_fences():
+    frame = pd.DataFrame({
+        "Content_Type": pd.Categorical(["Marketing"] * 5 + ["Learning"] * 2),
+        "Author_Type": pd.Categorical(["Ai"] * 5 + ["Human"] * 2),
+        "Engagement_Score": np.array([1, 2, 3, 4, 100, 10, 20], dtype=np.float32),
+    })
+    stats = dashboard.box_summary(frame).set_index(["Content_Type", "Author_Type"])
+
+    # 100 lies beyond q3 + 1.5 * IQR = 7, so the upper whisker stops at 4
+    marketing = stats.loc[("Marketing", "Ai")]
+    assert marketing[["q1", "median", "q3", "lowerfence", "upperfence"]].tolist() == [2.0, 3.0, 4.0, 1.0, 4.0]
+    learning = stats.loc[("Learning", "Human")]
+    assert learning[["q1", "median", "q3", "lowerfence", "upperfence"]].tolist() == [12.5, 15.0, 17.5, 10.0, 20.0]
+
+
+def test_engagement_trend_kernel_matches_pandas(monkeypatch):
+    rng = np.random.default_rng(0)
+    n = 200
+    scores = rng.uniform(0, 500, n)
+    scores[::17] = np.nan
+    authors = rng.choice(["Ai", "Human", "Hybrid"], n).astype(object)
+    authors[::23] = None  # null Author_Type -> category code -1
+    frame = pd.DataFrame({
+        "Date": pd.Timestamp("2025-07-01") + pd.to_timedelta(rng.integers(0, 30, n), unit="D"),
+        "Author_Type": pd.Categorical(authors, categories=["Ai", "Human", "Hybrid"]),
+        "Engagement_Score": scores,
+    })
+
+    kernel = dashboard.engagement_trend(frame)
+    monkeypatch.setattr(dashboard, "njit", None)
+    expected = dashboard.engagement_trend(frame)
+
+    assert kernel["Date"].tolist() == expected["Date"].tolist()
+    assert kernel["Author_Type"].tolist() == expected["Author_Type"].tolist()
+    assert kernel["Engagement_Score"].isna().any()  # some groups hold only NaN scores
+    np.testing.assert_allclose(kernel["Engagement_Score"], expected["Engagement_Score"], equal_nan=True)
+
+
+def test_duplicate_check_runs_with_existing_snapshot(tmp_path, monkeypatch, capsys):
+    csv_path = write_csv(
+        tmp_path,
+        "1,AI,Marketing,10,2,1,17-08-2025,44,17\n"
+        "1,AI,Marketing,10,2,1,17-08-2025,44,17\n",
+    )
+    dashboard.load_dataset(csv_path)  # writes the snapshot
+    capsys.readouterr()
+
+    monkeypatch.setenv("DASHBOARD_CHECK_DUPLICATES", "1")
+    df = dashboard.load_dataset(csv_path)
+    assert "Duplicates: 1 by ['Post_ID'], 1 full rows" in capsys.readouterr().err
+    assert len(df) == 1
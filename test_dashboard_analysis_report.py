@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+import dashboard
+import dashboard_analysis_report as report
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_report_with_single_author_type(tmp_path, monkeypatch, use_numba):
+    if not use_numba:
+        monkeypatch.setattr(report, "njit", None)
+    (tmp_path / "ai_vs_human_content_dataset.csv").write_text(
+        "Post_ID,Author_Type,Content_Type,Likes,Comments,Shares,Date,Word_Count,Engagement_Score\n"
+        "1,AI,Marketing,10,2,1,17-08-2025,44,17\n"
+        "2,AI,Learning,20,1,0,15-07-2025,50,22\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+
+    insights, df = report.load_and_analyze_data()
+    assert insights['ai_posts'] == 2
+    assert insights['human_posts'] == 0
+    assert insights['ai_avg_engagement'] == 19.5
+    assert np.isnan(insights['human_avg_engagement'])
+
+    doc = report.create_analysis_report(insights, df)
+    assert doc.paragraphs
+
+
+def test_numba_and_pandas_author_means_agree(tmp_path, monkeypatch):
+    csv_path = tmp_path / "ai_vs_human_content_dataset.csv"
+    csv_path.write_text(
+        "Post_ID,Author_Type,Content_Type,Likes,Comments,Shares,Date,Word_Count,Engagement_Score\n"
+        "1,AI,Marketing,10,2,1,17-08-2025,44,17\n"
+        "2,AI,Learning,,1,0,15-07-2025,50,22\n"
+        "3,AI,Learning,30,4,2,16-07-2025,50,44\n"
+        "4,,Learning,99,9,9,16-07-2025,50,144\n",
+        encoding="utf-8",
+    )
+    df = dashboard.load_dataset(csv_path)
+
+    numba_means = report.author_means(df).reindex(['Ai', 'Human'])
+    monkeypatch.setattr(report, "njit", None)
+    pandas_means = report.author_means(df).reindex(['Ai', 'Human'])
+
+    for means in (numba_means, pandas_means):
+        assert means.loc['Ai', 'n'] == 3
+        assert means.loc['Ai', 'likes_mean'] == 20.0  # blank Likes is skipped
+        assert means.loc['Human'].drop('n').isna().all()
+        assert (means.dtypes.drop('n') == 'float64').all()
+    np.testing.assert_allclose(
+        numba_means.drop(columns='n').to_numpy(),
+        pandas_means.drop(columns='n').to_numpy(),
+        equal_nan=True,
+    )